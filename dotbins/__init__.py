@@ -10,12 +10,25 @@ environments, with binaries tracked in your dotfiles git repository.
 
 from __future__ import annotations
 
+import importlib
 from importlib.metadata import version
+from typing import TYPE_CHECKING, Any
 
 __version__ = version("dotbins")
 
-# Re-export commonly used functions
-from . import cli, config, download, summary, utils
+# Re-export commonly used modules, imported on first access (PEP 562)
+_SUBMODULES = ("cli", "config", "download", "summary", "utils")
+
+if TYPE_CHECKING:
+    from . import cli, config, download, summary, utils
+
+
+def __getattr__(name: str) -> Any:
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
 
 __all__ = [
     "__version__",
@@ -10,7 +10,7 @@ from rich_argparse import RichHelpFormatter
 
 from . import __version__
 from .config import DEFAULT_TOOLS_DIR, Config, build_tool_config
-from .utils import current_platform, log, replace_home_in_path
+from .utils import DEFAULT_MAX_WORKERS, current_platform, log, replace_home_in_path
 
 
 def _list_tools(config: Config) -> None:
@@ -130,6 +130,18 @@ def _get_tool(
     return exit_code  # noqa: RET504
 
 
+def _positive_int(value: str) -> int:
+    """Parse a strictly positive integer argument."""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        msg = f"must be a positive integer, got {value!r}"
+        raise argparse.ArgumentTypeError(msg)
+    return number
+
+
 def create_parser() -> argparse.ArgumentParser:
     """Create command-line argument parser."""
     parser = argparse.ArgumentParser(
@@ -243,6 +255,13 @@ def create_parser() -> argparse.ArgumentParser:
         type=str,
         help="GitHub token to use for API requests (helps with rate limits and private repos)",
     )
+    sync_parser.add_argument(
+        "--max-workers",
+        type=_positive_int,
+        default=DEFAULT_MAX_WORKERS,
+        help="Maximum number of parallel release lookups and downloads"
+        f" (default: {DEFAULT_MAX_WORKERS})",
+    )
 
     # init command
     _init_parser = subparsers.add_parser(
@@ -355,6 +374,7 @@ def main() -> None:  # pragma: no cover
                 verbose=args.verbose,
                 generate_shell_scripts=not args.no_shell_scripts,
                 pin_to_manifest=args.pin_to_manifest,
+                max_workers=args.max_workers,
             )
             if config._update_summary.failed:
                 sys.exit(1)
@@ -9,33 +9,37 @@ import sys
 from dataclasses import dataclass, field
 from functools import cached_property, partial
 from pathlib import Path
-from typing import Literal, TypedDict
-
-import requests
-import yaml
+from typing import IO, Any, Literal, TypedDict
 
 from .detect_asset import create_system_detector
-from .download import download_files_in_parallel, prepare_download_tasks, process_downloaded_files
+from .download import (
+    download_and_process_files,
+    prepare_download_tasks,
+    skip_pinned_up_to_date_tools,
+)
 from .manifest import Manifest
 from .readme import write_readme_file
 from .summary import UpdateSummary, display_update_summary
 from .utils import (
+    DEFAULT_MAX_WORKERS,
     SUPPORTED_SHELLS,
     current_platform,
     execute_in_parallel,
     fetch_release_info,
     github_url_to_raw_url,
+    http_session,
     humanize_time_ago,
     log,
     replace_home_in_path,
+    size_http_pool,
     tag_to_version,
     write_shell_scripts,
 )
 
 if sys.version_info >= (3, 11):
-    from typing import Required
+    from typing import NotRequired, Required
 else:  # pragma: no cover
-    from typing_extensions import Required
+    from typing_extensions import NotRequired, Required
 
 DEFAULT_TOOLS_DIR = "~/.dotbins"
 DEFAULT_PREFER_APPIMAGE = True
@@ -102,6 +106,7 @@ class Config:
         tools: list[str] | None = None,
         github_token: str | None = None,
         verbose: bool = False,
+        max_workers: int = DEFAULT_MAX_WORKERS,
     ) -> None:
         """Set the latest releases for all tools."""
         if tools is None:
@@ -113,7 +118,7 @@ class Config:
             verbose=verbose,
             github_token=github_token,
         )
-        execute_in_parallel(tool_configs, fetch, max_workers=16)
+        execute_in_parallel(tool_configs, fetch, max_workers=max_workers)
 
     @cached_property
     def manifest(self) -> Manifest:
@@ -142,15 +147,21 @@ class Config:
 
     def make_binaries_executable(self: Config) -> None:
         """Make all binaries executable."""
+        if os.name == "nt":
+            return
         for platform, architectures in self.platforms.items():
             for arch in architectures:
-                bin_dir = self.bin_dir(platform, arch)
-                if os.name == "nt":
+                try:
+                    entries = os.scandir(self.bin_dir(platform, arch))
+                except FileNotFoundError:
                     continue
-                if bin_dir.exists():
-                    for binary in bin_dir.iterdir():
-                        if binary.is_file():
-                            binary.chmod(binary.stat().st_mode | 0o755)
+                with entries:
+                    for entry in entries:
+                        if not entry.is_file():
+                            continue
+                        mode = entry.stat().st_mode
+                        if mode & 0o755 != 0o755:  # only chmod when the mode changes
+                            Path(entry.path).chmod(mode | 0o755)
 
     def generate_readme(self: Config, write_file: bool = True, verbose: bool = False) -> None:
         """Generate a README.md file in the tools directory with information about installed tools.
@@ -177,6 +188,7 @@ class Config:
         verbose: bool = False,
         generate_shell_scripts: bool = True,
         pin_to_manifest: bool = False,
+        max_workers: int = DEFAULT_MAX_WORKERS,
     ) -> None:
         """Install and update tools to their latest versions.
 
@@ -204,8 +216,15 @@ class Config:
             verbose: If True, show detailed logs during the process
             generate_shell_scripts: If True, generate shell scripts for the tools
             pin_to_manifest: If True, use the tag from the `manifest.json` file
+            max_workers: Maximum number of parallel release lookups and downloads
+
+        Raises:
+            ValueError: If `max_workers` is smaller than 1.
 
         """
+        if max_workers < 1:
+            msg = f"max_workers must be a positive integer, got {max_workers}"
+            raise ValueError(msg)
         if not self.tools:
             log("No tools configured", "error")
             return
@@ -226,12 +245,21 @@ class Config:
                 tool_config.tag = tag
 
         tools_to_sync = _tools_to_sync(self, tools)
-        self.set_latest_releases(tools_to_sync, github_token, verbose)
         platforms_to_sync, architecture = _platforms_and_archs_to_sync(
             platform,
             architecture,
             current,
         )
+        tools_to_sync = skip_pinned_up_to_date_tools(
+            self,
+            tools_to_sync,
+            platforms_to_sync,
+            architecture,
+            current,
+            force,
+        )
+        size_http_pool(max_workers)
+        self.set_latest_releases(tools_to_sync, github_token, verbose, max_workers)
         download_tasks = prepare_download_tasks(
             self,
             tools_to_sync,
@@ -241,13 +269,13 @@ class Config:
             force,
             verbose,
         )
-        download_successes = download_files_in_parallel(download_tasks, github_token, verbose)
-        process_downloaded_files(
+        download_and_process_files(
             download_tasks,
-            download_successes,
+            github_token,
             self.manifest,
             self._update_summary,
             verbose,
+            max_workers,
         )
         self.make_binaries_executable()
 
@@ -281,8 +309,8 @@ def _maybe_copy_config_file(
     tools_config_path = tools_dir / "dotbins.yaml"
     if tools_config_path.exists():
         try:
-            cfg1 = yaml.safe_load(config_path.read_text())
-            cfg2 = yaml.safe_load(tools_config_path.read_text())
+            cfg1 = _load_yaml(config_path.read_text())
+            cfg2 = _load_yaml(tools_config_path.read_text())
         except Exception:  # pragma: no cover
             return
         is_same = cfg1 == cfg2
@@ -342,6 +370,12 @@ class ToolConfig:
         assert self._release_info is not None
         return self._release_info["tag_name"]
 
+    @cached_property
+    def assets_by_name(self) -> dict[str, _AssetDict]:
+        """Map the asset names of the release to the assets, built once per tool."""
+        assert self._release_info is not None
+        return {asset["name"]: asset for asset in self._release_info["assets"]}
+
 
 @dataclass(frozen=True)
 class BinSpec:
@@ -386,7 +420,7 @@ class BinSpec:
                 self.tool_config.defaults,
                 self.tool_config.tool_name,
             )
-        return _find_matching_asset(asset_pattern, assets)
+        return _find_matching_asset(asset_pattern, assets, self.tool_config.assets_by_name)
 
     def skip_download(self, config: Config, force: bool) -> bool:
         """Check if download should be skipped (binary already exists)."""
@@ -446,6 +480,7 @@ class _AssetDict(TypedDict):
 
     name: str
     browser_download_url: str
+    digest: NotRequired[str | None]  # e.g. "sha256:...", absent for older releases
 
 
 def build_tool_config(
@@ -506,15 +541,25 @@ def build_tool_config(
     )
 
 
+def _load_yaml(stream: str | bytes | IO[str]) -> Any:
+    """Like `yaml.safe_load`, but with the libyaml-based loader when available."""
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(stream, Loader=loader)  # noqa: S506
+
+
 def config_from_file(config_path: str | Path | None = None) -> Config:
     """Load configuration from YAML, or return defaults if no file found."""
+    import yaml
+
     path = _find_config_file(config_path)
     if path is None:
         return Config()
 
     try:
         with open(path) as f:
-            data: RawConfigDict = yaml.safe_load(f) or {}  # type: ignore[assignment]
+            data: RawConfigDict = _load_yaml(f) or {}  # type: ignore[assignment]
     except FileNotFoundError:  # pragma: no cover
         log(f"Configuration file not found: {path}", "warning")
         return Config()
@@ -564,13 +609,16 @@ def _config_from_dict(data: RawConfigDict) -> Config:
 
 def config_from_url(config_url: str) -> Config:
     """Download a configuration file from a URL and return a Config object."""
+    import requests
+    import yaml
+
     from .config import Config
 
     config_url = github_url_to_raw_url(config_url)
     try:
-        response = requests.get(config_url, timeout=30)
+        response = http_session().get(config_url, timeout=30)
         response.raise_for_status()
-        yaml_data = yaml.safe_load(response.content)
+        yaml_data = _load_yaml(response.content)
         return Config.from_dict(yaml_data)
     except requests.RequestException as e:  # pragma: no cover
         log(f"Failed to download configuration: {e}", "error", print_exception=True)
@@ -720,6 +768,10 @@ def _validate_tool_config(tool_name: str, tool_config: ToolConfig) -> None:
         )
 
 
+# Placeholders left in a pattern after formatting (e.g. escaped as `{{version}}`)
+_UNFILLED_VARIABLE = re.compile(r"\{(?:version|tag|arch|platform)\}")
+
+
 def _maybe_asset_pattern(
     tool_config: ToolConfig,
     platform: str,
@@ -738,19 +790,13 @@ def _maybe_asset_pattern(
             "ℹ️",  # noqa: RUF001
         )
         return None
-    version = tag_to_version(tag)
-    return (
-        search_pattern.format(
-            version=version,
-            tag=tag,
-            platform=tool_platform,
-            arch=tool_arch,
-        )
-        .replace("{version}", ".*")
-        .replace("{tag}", ".*")
-        .replace("{arch}", ".*")
-        .replace("{platform}", ".*")
-    )
+    variables = {
+        "version": tag_to_version(tag),
+        "tag": tag,
+        "platform": tool_platform,
+        "arch": tool_arch,
+    }
+    return _UNFILLED_VARIABLE.sub(".*", search_pattern.format_map(variables))
 
 
 def _auto_detect_asset(
@@ -796,15 +842,23 @@ def _auto_detect_asset(
 def _find_matching_asset(
     asset_pattern: str,
     assets: list[_AssetDict],
+    assets_by_name: dict[str, _AssetDict] | None = None,
 ) -> _AssetDict | None:
-    """Find a matching asset for the tool."""
+    """Find a matching asset for the tool.
+
+    A fully formatted pattern is often just the asset name, so an exact lookup
+    in `assets_by_name` is tried before scanning the assets with the regex.
+    """
     log(f"Looking for asset with pattern: {asset_pattern}", "info")
-    for asset in assets:
-        if re.search(asset_pattern, asset["name"]):
-            log(f"Found matching asset: {asset['name']}", "success")
-            return asset
-    log(f"No asset matching '{asset_pattern}' found in {assets}", "warning")
-    return None
+    asset = assets_by_name.get(asset_pattern) if assets_by_name is not None else None
+    if asset is None:
+        regex = re.compile(asset_pattern)
+        asset = next((a for a in assets if regex.search(a["name"])), None)
+    if asset is None:
+        log(f"No asset matching '{asset_pattern}' found in {assets}", "warning")
+        return None
+    log(f"Found matching asset: {asset['name']}", "success")
+    return asset
 
 
 def _fetch_release(
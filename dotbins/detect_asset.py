@@ -239,47 +239,45 @@ def _sorted(
 
 
 def _musl_or_gnu(assets_list: Assets, libc_preference: Literal["musl", "glibc"]) -> Assets:
-    gnu = _sort_arch([a for a in assets_list if _is_gnu(a)])
-    musl = _sort_arch([a for a in assets_list if _is_musl(a)])
-    others = _sort_arch([a for a in assets_list if not _is_gnu(a) and not _is_musl(a)])
+    musl, gnu, others = _split_by_abi(assets_list, "musl", "gnu")
     return musl + gnu + others if libc_preference == "musl" else gnu + musl + others
 
 
 def _msvc_or_gnu(assets_list: Assets, windows_abi: Literal["msvc", "gnu"]) -> Assets:
-    msvc = _sort_arch([a for a in assets_list if _is_msvc(a)])
-    gnu = _sort_arch([a for a in assets_list if _is_gnu(a)])
-    others = _sort_arch([a for a in assets_list if not _is_msvc(a) and not _is_gnu(a)])
+    msvc, gnu, others = _split_by_abi(assets_list, "msvc", "gnu")
     return msvc + gnu + others if windows_abi == "msvc" else gnu + msvc + others
 
 
+def _split_by_abi(assets_list: Assets, first: str, second: str) -> tuple[Assets, Assets, Assets]:
+    """Split assets into those mentioning `first`, `second`, or neither, in a single pass."""
+    firsts: Assets = []
+    seconds: Assets = []
+    others: Assets = []
+    for asset in assets_list:
+        basename = os.path.basename(asset).lower()
+        in_first = first in basename
+        in_second = second in basename
+        if in_first:
+            firsts.append(asset)
+        if in_second:
+            seconds.append(asset)
+        if not in_first and not in_second:
+            others.append(asset)
+    return _sort_arch(firsts), _sort_arch(seconds), _sort_arch(others)
+
+
 def _sort_arch(assets_list: Assets) -> Assets:
     def arch_priority(asset: str) -> tuple[int, str]:
+        lower = asset.lower()
         # Prefer i686 (newer) over i386 (older)
-        if "i686" in asset.lower():
-            return 0, asset
-        if "i586" in asset.lower():
-            return 1, asset
-        if "i486" in asset.lower():
-            return 2, asset
-        if "i386" in asset.lower():
-            return 3, asset
+        for priority, name in enumerate(("i686", "i586", "i486", "i386")):
+            if name in lower:
+                return priority, asset
         return 100, asset  # Other architectures, don't change their order
 
     return sorted(assets_list, key=arch_priority)
 
 
-def _is_msvc(asset: str) -> bool:
-    return "msvc" in os.path.basename(asset).lower()
-
-
-def _is_musl(asset: str) -> bool:
-    return "musl" in os.path.basename(asset).lower()
-
-
-def _is_gnu(asset: str) -> bool:
-    return "gnu" in os.path.basename(asset).lower()
-
-
 def _detect_system(
     os_obj: _OS,
     arch: _Arch,
@@ -42,61 +42,40 @@ def _is_exec(filename: str, mode: int) -> bool:
     return _is_likely_exec(filename)
 
 
-def _binary_chooser(name: str, mode: int, target_name: str) -> tuple[bool, bool]:
-    basename = Path(name).name
+def _scan_executables(extracted_dir: Path) -> list[Path]:
+    """Return the (likely) executables below `extracted_dir`, relative to it.
 
-    is_direct = (
-        basename in (target_name, f"{target_name}.exe", f"{target_name}.appimage")
-    ) and _is_exec(name, mode)
-
-    is_possible = _is_exec(name, mode)
-
-    return is_direct, is_possible
-
-
-def _substring_chooser(
-    name: str,
-    mode: int,
-    substring: str,
-) -> tuple[bool, bool]:
-    basename = Path(name).name
-    return False, substring.lower() in basename.lower() and _is_exec(name, mode)
-
-
-def _find_best_binary_match(
-    extracted_dir: Path,
-    binary_name: str,
-) -> Path | None:
-    exact_matches = []
-    bin_dir_matches = []
-    substring_matches = []
-
-    for root, _, files in os.walk(extracted_dir):
-        for file in files:
-            file_path = Path(root) / file
-            rel_path = file_path.relative_to(extracted_dir)
-            mode = file_path.stat().st_mode
-
-            # Try exact match
-            is_match, _ = _binary_chooser(str(rel_path), mode, binary_name)
-            if is_match:
-                exact_matches.append(rel_path)
-
-            # Track bin directory matches
-            if "bin/" in str(rel_path) and _is_exec(str(rel_path), mode):
-                bin_dir_matches.append(rel_path)
-
-            # Track substring matches
-            _, is_match = _substring_chooser(str(rel_path), mode, binary_name)
-            if is_match:
-                substring_matches.append(rel_path)
-
-    # Return results in order of preference
-    exact_matches = sorted(exact_matches)
+    Uses `os.scandir` so each file is stat'ed only once, no matter how many
+    binaries are looked up afterwards.
+    """
+    executables = []
+    stack = [extracted_dir]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir():
+                    if not entry.is_symlink():  # like os.walk, don't follow symlinked dirs
+                        stack.append(Path(entry.path))
+                    continue
+                try:
+                    mode = entry.stat().st_mode
+                except OSError:  # broken symlink
+                    continue
+                rel_path = Path(entry.path).relative_to(extracted_dir)
+                if _is_exec(str(rel_path), mode):
+                    executables.append(rel_path)
+    return sorted(executables)
+
+
+def _find_best_binary_match(executables: list[Path], binary_name: str) -> Path | None:
+    # Try exact match
+    exact_names = (binary_name, f"{binary_name}.exe", f"{binary_name}.appimage")
+    exact_matches = [p for p in executables if p.name in exact_names]
     if exact_matches:
         return exact_matches[0]
 
-    bin_dir_matches = sorted(bin_dir_matches)
+    # Then bin directory matches
+    bin_dir_matches = [p for p in executables if "bin/" in str(p)]
     if bin_dir_matches:
         # For bin_dir matches, prefer ones with the binary name in them
         named_matches = [p for p in bin_dir_matches if binary_name in p.name]
@@ -104,7 +83,8 @@ def _find_best_binary_match(
             return named_matches[0]
         return bin_dir_matches[0]
 
-    substring_matches = sorted(substring_matches)
+    # Then substring matches
+    substring_matches = [p for p in executables if binary_name.lower() in p.name.lower()]
     if substring_matches:
         return substring_matches[0]
 
@@ -122,10 +102,11 @@ def auto_detect_paths_in_archive(extracted_dir: Path, binary_names: list[str]) -
         List of detected binary paths (relative to extracted_dir)
 
     """
+    executables = _scan_executables(extracted_dir)
     detected_paths = []
 
     for binary_name in binary_names:
-        path_in_archive = _find_best_binary_match(extracted_dir, binary_name)
+        path_in_archive = _find_best_binary_match(executables, binary_name)
         if path_in_archive:
             detected_paths.append(path_in_archive)
 
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import os
+import posixpath
+import re
 import shutil
 import tempfile
 from functools import partial
@@ -11,17 +13,19 @@ from typing import TYPE_CHECKING, NamedTuple
 
 from .detect_binary import auto_detect_extract_archive, auto_detect_paths_in_archive
 from .utils import (
+    DEFAULT_MAX_WORKERS,
     calculate_sha256,
     download_file,
-    execute_in_parallel,
     extract_archive,
+    extract_members_to,
+    iterate_in_parallel,
     log,
     replace_home_in_path,
     tag_to_version,
 )
 
 if TYPE_CHECKING:
-    from .config import BinSpec, Config, ToolConfig
+    from .config import BinSpec, Config, ToolConfig, _AssetDict
     from .manifest import Manifest
     from .summary import UpdateSummary
 
@@ -34,12 +38,28 @@ def _extract_binary_from_archive(
 ) -> None:
     """Extract binaries from an archive."""
     log(f"Extracting from {archive_path} for {bin_spec.platform}", "info", "📦")
-    temp_dir = Path(tempfile.mkdtemp())
+    members = [
+        _replace_variables_in_path(
+            str(path),
+            bin_spec.tag,
+            bin_spec.tool_arch,
+            bin_spec.tool_platform,
+        )
+        for path in bin_spec.tool_config.path_in_archive
+    ]
+    try:
+        if _extract_binaries_directly(archive_path, destination_dir, members, bin_spec):
+            return
+    except Exception as e:
+        log(f"Error extracting archive: {e}", "error", print_exception=verbose)
+        raise
 
+    temp_dir = Path(tempfile.mkdtemp())
     try:
-        extract_archive(archive_path, temp_dir)
+        extract_archive(archive_path, temp_dir, members)
         log(f"Archive extracted to {temp_dir}", "success", "📦")
-        _log_extracted_files(temp_dir)
+        if verbose:
+            _log_extracted_files(temp_dir)
         paths_in_archive = _detect_paths_in_archive(temp_dir, bin_spec.tool_config)
         _process_binaries(temp_dir, destination_dir, paths_in_archive, bin_spec)
 
@@ -47,7 +67,36 @@ def _extract_binary_from_archive(
         log(f"Error extracting archive: {e}", "error", print_exception=verbose)
         raise
     finally:
-        shutil.rmtree(temp_dir)
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def _extract_binaries_directly(
+    archive_path: Path,
+    destination_dir: Path,
+    members: list[str],
+    bin_spec: BinSpec,
+) -> bool:
+    """Write explicitly configured binaries straight from the archive to their destination.
+
+    Returns False if the paths are not exact (globs or auto-detection), several
+    binaries share a member, or the archive can't be read this way, in which
+    case the archive is extracted to a temporary directory instead.
+    """
+    if not members or any(c in m for m in members for c in "*?["):
+        return False
+    if len({posixpath.normpath(m) for m in members}) != len(members):
+        return False
+    targets = {
+        member: _binary_destination(destination_dir, binary_name, Path(member).suffix)
+        for member, binary_name in zip(members, bin_spec.tool_config.binary_name)
+    }
+    destination_dir.mkdir(parents=True, exist_ok=True)
+    if not extract_members_to(archive_path, targets):
+        return False
+    log(f"Extracted {', '.join(targets)} from {archive_path}", "success", "📦")
+    for dest_path in targets.values():
+        _set_executable(dest_path)
+    return True
 
 
 class AutoDetectBinaryPathsError(Exception):
@@ -76,16 +125,22 @@ def _process_binaries(
     paths_in_archive: list[Path],
     bin_spec: BinSpec,
 ) -> None:
-    """Process each binary by finding it and copying to destination."""
-    for path_in_archive, binary_name in zip(paths_in_archive, bin_spec.tool_config.binary_name):
-        source_path = _find_binary_in_extracted_files(
+    """Process each binary by finding it and moving it to its destination."""
+    source_paths = [
+        _find_binary_in_extracted_files(
             temp_dir,
             str(path_in_archive),
             bin_spec.tag,
             bin_spec.tool_arch,
             bin_spec.tool_platform,
         )
-        _copy_binary_to_destination(source_path, destination_dir, binary_name)
+        for path_in_archive in paths_in_archive
+    ]
+    binary_names = bin_spec.tool_config.binary_name
+    for i, (source_path, binary_name) in enumerate(zip(source_paths, binary_names)):
+        # Several binary names may point at the same file, only the last one can move it
+        keep_source = source_path in source_paths[i + 1 : len(binary_names)]
+        _move_binary_to_destination(source_path, destination_dir, binary_name, keep_source)
 
 
 def _log_extracted_files(temp_dir: Path) -> None:
@@ -106,11 +161,11 @@ def _find_binary_in_extracted_files(
     path_in_archive = _replace_variables_in_path(path_in_archive, tag, tool_arch, tool_platform)
 
     if "*" in path_in_archive:
-        matches = list(temp_dir.glob(path_in_archive))
-        if not matches:
+        match = next(temp_dir.glob(path_in_archive), None)
+        if match is None:
             msg = f"No files matching {path_in_archive} in archive"
             raise FileNotFoundError(msg)
-        return matches[0]
+        return match
 
     source_path = temp_dir / path_in_archive
     if not source_path.exists():
@@ -120,42 +175,57 @@ def _find_binary_in_extracted_files(
     return source_path
 
 
-def _copy_binary_to_destination(
+def _move_binary_to_destination(
     source_path: Path,
     destination_dir: Path,
     binary_name: str,
+    keep_source: bool = False,
 ) -> None:
-    """Copy the binary to its destination and set permissions."""
+    """Move the binary to its destination and set permissions.
+
+    The source is always a temporary file, so it is moved rather than copied:
+    a plain rename when on the same filesystem, otherwise a kernel-side copy.
+    With `keep_source`, it is copied because it is installed again afterwards.
+    """
     destination_dir.mkdir(parents=True, exist_ok=True)
+    dest_path = _binary_destination(destination_dir, binary_name, source_path.suffix)
+    if keep_source or source_path.is_symlink():
+        # Moving a symlink would keep the link (relative to the temp dir), so copy its target
+        shutil.copy2(source_path, dest_path)
+    else:
+        shutil.move(source_path, dest_path)
+    _set_executable(dest_path)
+
+
+def _binary_destination(destination_dir: Path, binary_name: str, suffix: str) -> Path:
+    """Return the path a binary is installed to."""
     dest_path = destination_dir / binary_name
     if os.name == "nt":
         # Maintain the original extension on Windows
-        dest_path = dest_path.with_suffix(source_path.suffix)
-    shutil.copy2(source_path, dest_path)
-    if os.name == "nt":
-        # Windows doesn't use the same executable bit concept, so just ensure write access
-        dest_path.chmod(dest_path.stat().st_mode)
-    else:
-        dest_path.chmod(dest_path.stat().st_mode | 0o755)
-    log(f"Copied binary to [b]{replace_home_in_path(dest_path, '~')}[/]", "success")
+        dest_path = dest_path.with_suffix(suffix)
+    return dest_path
 
 
-def _replace_variables_in_path(path: str, tag: str, arch: str, platform: str) -> str:
-    """Replace variables in a path with their values."""
-    version = tag_to_version(tag)
-    if "{version}" in path and version:
-        path = path.replace("{version}", version)
+def _set_executable(dest_path: Path) -> None:
+    """Set the permissions of an installed binary, skipping chmod if they are already right."""
+    # Windows doesn't use the same executable bit concept (chmod with the mode
+    # from stat would leave it unchanged)
+    if os.name != "nt":
+        mode = dest_path.stat().st_mode
+        if mode & 0o755 != 0o755:
+            dest_path.chmod(mode | 0o755)
+    log(f"Installed binary to [b]{replace_home_in_path(dest_path, '~')}[/]", "success")
 
-    if "{tag}" in path and tag:
-        path = path.replace("{tag}", tag)
 
-    if "{arch}" in path and arch:
-        path = path.replace("{arch}", arch)
+_PATH_VARIABLE = re.compile(r"\{(version|tag|arch|platform)\}")
 
-    if "{platform}" in path and platform:
-        path = path.replace("{platform}", platform)
 
-    return path
+def _replace_variables_in_path(path: str, tag: str, arch: str, platform: str) -> str:
+    """Replace variables in a path with their values, leaving empty ones untouched."""
+    if "{" not in path:
+        return path
+    values = {"version": tag_to_version(tag), "tag": tag, "arch": arch, "platform": platform}
+    return _PATH_VARIABLE.sub(lambda m: values[m[1]] or m[0], path)
 
 
 class _DownloadTask(NamedTuple):
@@ -222,9 +292,18 @@ def _prepare_download_task(
                 reason="No matching asset found",
             )
             return None
+        if not force and _reuse_identical_asset(config, bin_spec, asset):
+            config._update_summary.add_skipped_tool(
+                tool_name,
+                platform,
+                arch,
+                tag=bin_spec.tag,
+                reason="Identical asset already installed",
+            )
+            return None
         tmp_dir = Path(tempfile.gettempdir())
         asset_filename = asset["browser_download_url"].split("/")[-1]
-        temp_path = tmp_dir / f"{platform}-{arch}-{asset_filename}"
+        temp_path = tmp_dir / f"{tool_name}-{platform}-{arch}-{asset_filename}"
         return _DownloadTask(
             bin_spec=bin_spec,
             asset_url=asset["browser_download_url"],
@@ -299,12 +378,118 @@ def prepare_download_tasks(
     return sorted(download_tasks, key=lambda t: (t.tool_name, t.platform, t.arch))
 
 
+def skip_pinned_up_to_date_tools(
+    config: Config,
+    tools_to_sync: list[str] | None,
+    platforms_to_sync: list[str] | None,
+    architecture: str | None,
+    current: bool,
+    force: bool,
+) -> list[str]:
+    """Drop tools with a pinned tag that are already installed for every target.
+
+    For these tools the manifest alone tells us nothing needs to change, so we can
+    skip the GitHub API call for their release info entirely.
+
+    Returns:
+        The tools that still need their release info fetched.
+
+    """
+    if tools_to_sync is None:
+        tools_to_sync = list(config.tools)
+    if force:
+        return tools_to_sync
+    if platforms_to_sync is None:
+        platforms_to_sync = list(config.platforms)
+
+    targets = []
+    for platform in platforms_to_sync:
+        if current:
+            assert architecture is not None
+            targets.append((platform, architecture))
+            continue
+        archs = config.platforms.get(platform, [])
+        if architecture is not None:
+            archs = [architecture] if architecture in archs else []
+        targets.extend((platform, arch) for arch in archs)
+
+    remaining = []
+    for tool_name in tools_to_sync:
+        tool_config = config.tools[tool_name]
+        tag = tool_config.tag
+        if (
+            tag is None
+            or not targets
+            or not all(
+                _is_installed(config, tool_config, tag, platform, arch)
+                for platform, arch in targets
+            )
+        ):
+            remaining.append(tool_name)
+            continue
+        log(f"[b]{tool_name} {tag}[/] is already up to date for all targets", "success")
+        for platform, arch in targets:
+            config._update_summary.add_skipped_tool(tool_name, platform, arch, tag)
+    return remaining
+
+
+def _is_installed(
+    config: Config,
+    tool_config: ToolConfig,
+    tag: str,
+    platform: str,
+    arch: str,
+) -> bool:
+    tool_info = config.manifest.get_tool_info(tool_config.tool_name, platform, arch)
+    if not tool_info or tool_info["tag"] != tag:
+        return False
+    destination_dir = config.bin_dir(platform, arch)
+    return all((destination_dir / name).exists() for name in tool_config.binary_name)
+
+
+def _reuse_identical_asset(config: Config, bin_spec: BinSpec, asset: _AssetDict) -> bool:
+    """Record the new tag without downloading if the installed asset is byte-identical.
+
+    GitHub publishes a SHA256 `digest` for release assets. When it equals the hash
+    recorded in the manifest and the binaries exist, the download would change nothing.
+    """
+    tool_name = bin_spec.tool_config.tool_name
+    tool_info = config.manifest.get_tool_info(tool_name, bin_spec.platform, bin_spec.arch)
+    digest = asset.get("digest")
+    if not digest or tool_info is None or digest != f"sha256:{tool_info['sha256']}":
+        return False
+    destination_dir = config.bin_dir(bin_spec.platform, bin_spec.arch)
+    if not all((destination_dir / name).exists() for name in bin_spec.tool_config.binary_name):
+        return False
+    config.manifest.update_tool_info(
+        tool=tool_name,
+        platform=bin_spec.platform,
+        arch=bin_spec.arch,
+        tag=bin_spec.tag,
+        sha256=tool_info["sha256"],
+        url=asset["browser_download_url"],
+    )
+    log(
+        f"[b]{tool_name} {bin_spec.tag}[/] for [b]{bin_spec.platform}/{bin_spec.arch}[/]"
+        " ships the same asset as the installed version, skipping download",
+        "success",
+    )
+    return True
+
+
 def _download_task(
     task: _DownloadTask,
     github_token: str | None,
     verbose: bool,
-) -> bool:
-    """Download a file for a DownloadTask."""
+) -> str | None:
+    """Download a file for a DownloadTask.
+
+    Returns:
+        The SHA256 hash of the downloaded file, or None if the download failed.
+        Hashing here runs in the download thread while the file is still in the
+        page cache, instead of on the serial processing path.
+
+    """
     try:
         log(
             f"Downloading [b]{task.asset_name}[/] for [b]{task.tool_name}[/] ([b]{task.platform}/{task.arch}[/])...",
@@ -312,34 +497,89 @@ def _download_task(
             "📥",
         )
         download_file(task.asset_url, str(task.temp_path), github_token, verbose)
-        return True
+        return calculate_sha256(task.temp_path)
     except Exception as e:
         log(f"Error downloading {task.asset_name}: {e!s}", "error", print_exception=verbose)
-        return False
+        return None
 
 
-def download_files_in_parallel(
+def download_and_process_files(
     download_tasks: list[_DownloadTask],
     github_token: str | None,
+    manifest: Manifest,
+    summary: UpdateSummary,
     verbose: bool,
-) -> list[bool]:
-    """Download files in parallel."""
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> None:
+    """Download files in parallel and process each one as soon as it is downloaded.
+
+    Extraction of the first archives overlaps with the downloads of the rest,
+    while processing still happens in task order on the calling thread.
+    Tasks that resolve to the same asset (e.g., universal macOS binaries or
+    scripts) share a single download.
+    """
     if not download_tasks:
-        return []
-    log(f"Downloading {len(download_tasks)} tools in parallel...", "info", "🔄")
+        return
+    log(f"Downloading and processing {len(download_tasks)} tools in parallel...", "info", "🔄")
+    tasks_by_url: dict[str, list[_DownloadTask]] = {}
+    for task in download_tasks:
+        tasks_by_url.setdefault(task.asset_url, []).append(task)
+    unique_tasks = [tasks[0] for tasks in tasks_by_url.values()]
     func = partial(_download_task, github_token=github_token, verbose=verbose)
-    return execute_in_parallel(download_tasks, func, 16)
+    hashes = iterate_in_parallel(unique_tasks, func, max_workers)
+    for task, sha256_hash in zip(unique_tasks, hashes):
+        # If the download failed, the duplicates are reported as failed too
+        same_asset_tasks = [task]
+        same_asset_tasks.extend(
+            duplicate
+            for duplicate in tasks_by_url[task.asset_url][1:]
+            if sha256_hash is None or _reuse_download(task, duplicate, summary, verbose)
+        )
+        for same_asset_task in same_asset_tasks:
+            _process_downloaded_task(same_asset_task, sha256_hash, manifest, summary, verbose)
+
+
+def _reuse_download(
+    task: _DownloadTask,
+    duplicate: _DownloadTask,
+    summary: UpdateSummary,
+    verbose: bool,
+) -> bool:
+    """Copy the download of `task` to the temporary path of `duplicate`."""
+    log(
+        f"Reusing download of [b]{task.asset_name}[/] for [b]{duplicate.tool_name}[/]"
+        f" ([b]{duplicate.platform}/{duplicate.arch}[/])",
+        "info",
+    )
+    try:
+        shutil.copyfile(task.temp_path, duplicate.temp_path)
+    except OSError as e:
+        log(
+            f"Error copying download for {duplicate.tool_name}: {e!s}",
+            "error",
+            print_exception=verbose,
+        )
+        duplicate.temp_path.unlink(missing_ok=True)
+        summary.add_failed_tool(
+            duplicate.tool_name,
+            duplicate.platform,
+            duplicate.arch,
+            duplicate.tag,
+            reason=f"Error copying download: {e!s}",
+        )
+        return False
+    return True
 
 
 def _process_downloaded_task(
     task: _DownloadTask,
-    success: bool,
+    sha256_hash: str | None,
     manifest: Manifest,
     summary: UpdateSummary,
     verbose: bool,
 ) -> bool:
     """Process a downloaded file."""
-    if not success:
+    if sha256_hash is None:
         summary.add_failed_tool(
             task.tool_name,
             task.platform,
@@ -350,8 +590,6 @@ def _process_downloaded_task(
         return False
 
     try:
-        # Calculate SHA256 hash before extraction
-        sha256_hash = calculate_sha256(task.temp_path)
         log(f"SHA256: {sha256_hash}", "info", "🔐")
 
         task.destination_dir.mkdir(parents=True, exist_ok=True)
@@ -387,7 +625,7 @@ def _process_downloaded_task(
                 )
                 return False
             binary_name = binary_names[0]
-            _copy_binary_to_destination(task.temp_path, task.destination_dir, binary_name)
+            _move_binary_to_destination(task.temp_path, task.destination_dir, binary_name)
     except Exception as e:
         # Differentiate error types for better reporting
         error_prefix = "Error processing"
@@ -427,23 +665,7 @@ def _process_downloaded_task(
         )
         return True
     finally:
-        if task.temp_path.exists():
-            task.temp_path.unlink()
-
-
-def process_downloaded_files(
-    download_tasks: list[_DownloadTask],
-    download_successes: list[bool],
-    manifest: Manifest,
-    summary: UpdateSummary,
-    verbose: bool,
-) -> None:
-    """Process downloaded files."""
-    if not download_successes:
-        return
-    log(f"Processing {len(download_successes)} downloaded tools...", "info", "🔄")
-    for task, download_success in zip(download_tasks, download_successes):
-        _process_downloaded_task(task, download_success, manifest, summary, verbose)
+        task.temp_path.unlink(missing_ok=True)
 
 
 def _determine_architectures(
@@ -3,13 +3,11 @@
 from __future__ import annotations
 
 import json
+import os
 from collections import defaultdict
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, NamedTuple
 
-from rich.console import Console
-from rich.table import Table
-
 from .utils import humanize_time_ago, log, tag_to_version
 
 if TYPE_CHECKING:
@@ -62,13 +60,22 @@ class Manifest:
         return data
 
     def save(self) -> None:
-        """Save manifest to JSON file."""
+        """Save manifest to JSON file.
+
+        Written to a temporary file that replaces the manifest, so an interrupted
+        run never leaves a truncated `manifest.json` behind.
+        """
         self.manifest_file.parent.mkdir(parents=True, exist_ok=True)
-        with self.manifest_file.open("w", encoding="utf-8") as f:
-            sorted_data = dict(sorted(self.data.items()))
-            sorted_data.pop("version", None)
-            sorted_data = {"version": MANIFEST_VERSION, **sorted_data}
-            json.dump(sorted_data, f, indent=2)
+        sorted_data = dict(sorted(self.data.items()))
+        sorted_data.pop("version", None)
+        sorted_data = {"version": MANIFEST_VERSION, **sorted_data}
+        tmp_file = self.manifest_file.with_name(f".{self.manifest_file.name}.{os.getpid()}.tmp")
+        try:
+            with tmp_file.open("w", encoding="utf-8") as f:
+                json.dump(sorted_data, f, indent=2)
+            os.replace(tmp_file, self.manifest_file)
+        finally:
+            tmp_file.unlink(missing_ok=True)
 
     def get_tool_info(self, tool: str, platform: str, arch: str) -> dict[str, Any] | None:
         """Get version info for a specific tool/platform/arch combination."""
@@ -137,6 +144,9 @@ class Manifest:
             log("No tool versions recorded yet.", "info")
             return
 
+        from rich.console import Console
+        from rich.table import Table
+
         console = Console()
         table = Table(title="✅ Installed Tool Versions")
 
@@ -204,6 +214,9 @@ class Manifest:
             log("No tools found for the specified filters.", "info")
             return
 
+        from rich.console import Console
+        from rich.table import Table
+
         console = Console()
         table = Table(title="✅ Installed Tools Summary")
 
@@ -239,6 +252,9 @@ class Manifest:
             architecture: Filter by architecture (e.g., 'amd64', 'arm64')
 
         """
+        from rich.console import Console
+        from rich.table import Table
+
         console = Console()
 
         if compact:
@@ -6,9 +6,6 @@ import datetime
 import math
 from typing import TYPE_CHECKING, Any, NamedTuple
 
-from rich.console import Console
-from rich.markdown import Markdown
-
 from dotbins import __version__
 
 from .utils import current_platform, log, replace_home_in_path, tag_to_version
@@ -428,6 +425,9 @@ def write_readme_file(
             log(f"Unexpected error writing README: {e}", "error", print_exception=verbose)
 
     if print_content:
+        from rich.console import Console
+        from rich.markdown import Markdown
+
         console = Console()
         md = Markdown(readme_content)
         console.print(md)
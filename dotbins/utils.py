@@ -3,27 +3,36 @@
 from __future__ import annotations
 
 import bz2
+import fnmatch
 import functools
 import gzip
 import hashlib
+import json
 import lzma
 import os
 import platform as platform_module
+import posixpath
 import re
 import shutil
+import stat
 import sys
 import tarfile
+import tempfile
 import textwrap
+import time
 import zipfile
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable, Literal, TypeVar
+from pathlib import Path, PurePosixPath
+from typing import IO, TYPE_CHECKING, Any, Callable, Literal, TypeVar
 
-import requests
 from rich.console import Console
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+
+    import requests
+
     from .config import ToolConfig
 
 console = Console()
@@ -43,6 +52,67 @@ SUPPORTED_ARCHIVE_EXTENSIONS = [
     ".lzma",
 ]
 
+# Large enough that a typical release archive (1-30 MB) needs only a handful of writes
+DOWNLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+# Release JSON younger than this is reused from disk without contacting GitHub
+RELEASE_CACHE_TTL = 600  # seconds
+
+# Number of parallel release lookups and downloads, see `dotbins sync --max-workers`
+DEFAULT_MAX_WORKERS = 16
+
+# Number of hosts (api.github.com, the release CDN, ...) the HTTP session keeps a pool for
+_HTTP_POOL_CONNECTIONS = 8
+
+# Warn when fewer GitHub API requests than this are left in the rate limit window
+RATE_LIMIT_WARNING_THRESHOLD = 5
+
+
+@functools.cache
+def http_session() -> requests.Session:
+    """Return the HTTP session shared by all requests (keep-alive, pooling and retries).
+
+    Reusing one session avoids a new TCP connection and TLS handshake per request.
+    `requests` is imported here, so commands that don't touch the network don't pay for it.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util import Retry
+
+    from . import __version__
+
+    session = requests.Session()
+    session.headers["User-Agent"] = f"dotbins/{__version__}"
+    # Also retry when rate limited (429), waiting as long as GitHub's Retry-After asks
+    retries = Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=[429, 502, 503, 504],
+        respect_retry_after_header=True,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=_HTTP_POOL_CONNECTIONS,
+        pool_maxsize=DEFAULT_MAX_WORKERS,  # one connection per worker, see `size_http_pool`
+        max_retries=retries,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def size_http_pool(max_workers: int) -> None:
+    """Let the shared session keep one connection per host for each of `max_workers` threads.
+
+    Otherwise urllib3 discards the surplus connections after each request and
+    the extra workers pay for a new TLS handshake every time.
+    """
+    for adapter in http_session().adapters.values():
+        poolmanager = adapter.poolmanager  # type: ignore[attr-defined]
+        if poolmanager.connection_pool_kw["maxsize"] < max_workers:
+            poolmanager.clear()  # close the connections of the pools being replaced
+            adapter.init_poolmanager(_HTTP_POOL_CONNECTIONS, max_workers)  # type: ignore[attr-defined]
+
+
 SUPPORTED_SHELLS = ["bash", "zsh", "fish", "nushell", "powershell"]
 
 Shells = Literal["bash", "zsh", "fish", "nushell", "powershell"]
@@ -52,27 +122,119 @@ def _maybe_github_token_header(github_token: str | None) -> dict[str, str]:  # p
     return {} if github_token is None else {"Authorization": f"token {github_token}"}
 
 
+def release_cache_dir() -> Path:
+    """Return the directory where release JSON responses are cached."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(cache_home) / "dotbins" / "releases"
+
+
+def _release_cache_file(repo: str, tag: str | None) -> Path:
+    key = f"{repo}@{tag or 'latest'}"
+    return release_cache_dir() / (re.sub(r"[^\w.@-]", "_", key) + ".json")
+
+
+def _read_release_cache(cache_file: Path) -> dict[str, Any] | None:
+    try:
+        with cache_file.open(encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _temp_sibling(path: Path) -> tuple[int, Path]:
+    """Create a uniquely named temporary file next to `path` for an atomic `os.replace`.
+
+    The name must be unique per call, not just per process, because concurrent
+    threads may write the same destination.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    return fd, Path(tmp_path)
+
+
+def _write_release_cache(cache_file: Path, entry: dict[str, Any]) -> None:
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_file = _temp_sibling(cache_file)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp_file, cache_file)
+        finally:
+            tmp_file.unlink(missing_ok=True)
+    except OSError as e:  # pragma: no cover
+        log(f"Could not write release cache {cache_file}: {e}", "warning")
+
+
+def _warn_if_rate_limit_low(headers: Mapping[str, str]) -> None:
+    """Warn when the GitHub API rate limit is (almost) used up."""
+    remaining = headers.get("X-RateLimit-Remaining", "")
+    if not remaining.isdigit() or int(remaining) >= RATE_LIMIT_WARNING_THRESHOLD:
+        return
+    reset = headers.get("X-RateLimit-Reset", "")
+    until = (
+        f" until {time.strftime('%H:%M:%S', time.localtime(int(reset)))}" if reset.isdigit() else ""
+    )
+    log(
+        f"Only {remaining} GitHub API requests left{until}, set GITHUB_TOKEN to raise the rate limit",
+        "warning",
+    )
+
+
 @functools.cache
 def fetch_release_info(
     repo: str,
     tag: str | None = None,
     github_token: str | None = None,
 ) -> dict | None:
-    """Fetch release information from GitHub for a single repository."""
+    """Fetch release information from GitHub for a single repository.
+
+    Responses are cached on disk (see `release_cache_dir`) and reused without
+    a request for `RELEASE_CACHE_TTL` seconds. After that the cached response
+    is revalidated with a conditional request, a 304 reply does not count
+    against the GitHub rate limit.
+    """
     if tag is None:
         url = f"https://api.github.com/repos/{repo}/releases/latest"
     else:
         url = f"https://api.github.com/repos/{repo}/releases/tags/{tag}"
 
+    cache_file = _release_cache_file(repo, tag)
+    cached = _read_release_cache(cache_file)
+    if cached is not None and time.time() - cached.get("fetched_at", 0) < RELEASE_CACHE_TTL:
+        log(f"Using cached release for {repo}", "info")
+        return cached["data"]
+
     log(f"Fetching release from {url}", "info")
     headers = _maybe_github_token_header(github_token)
+    headers["Accept"] = "application/vnd.github+json"
+    if cached is not None:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+    import requests
+
     try:
-        response = requests.get(url, headers=headers, timeout=30)
+        response = http_session().get(url, headers=headers, timeout=30)
+        _warn_if_rate_limit_low(response.headers)
+        if cached is not None and response.status_code == 304:
+            log(f"Release for {repo} is unchanged", "info")
+            cached["fetched_at"] = time.time()
+            _write_release_cache(cache_file, cached)
+            return cached["data"]
         response.raise_for_status()
-        return response.json()
+        data = response.json()
     except requests.RequestException as e:
         msg = f"Failed to fetch release for {repo}: {e}"
         raise RuntimeError(msg) from e
+    entry = {
+        "fetched_at": time.time(),
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+        "data": data,
+    }
+    _write_release_cache(cache_file, entry)
+    return data
 
 
 def download_file(url: str, destination: str, github_token: str | None, verbose: bool) -> str:
@@ -80,14 +242,17 @@ def download_file(url: str, destination: str, github_token: str | None, verbose:
     log(f"Downloading from [b]{url}[/]", "info", "📥")
     # Already verbose when fetching release info
     headers = _maybe_github_token_header(github_token)
+    import requests
+    import urllib3
+
     try:
-        response = requests.get(url, stream=True, timeout=30, headers=headers)
+        response = http_session().get(url, stream=True, timeout=30, headers=headers)
         response.raise_for_status()
+        response.raw.decode_content = True  # same bytes as iter_content, minus the Python loop
         with open(destination, "wb") as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
+            shutil.copyfileobj(response.raw, f, DOWNLOAD_CHUNK_SIZE)
         return destination
-    except requests.RequestException as e:
+    except (requests.RequestException, urllib3.exceptions.HTTPError) as e:
         log(f"Download failed: {e}", "error", print_exception=verbose)
         msg = f"Failed to download {url}: {e}"
         raise RuntimeError(msg) from e
@@ -144,10 +309,13 @@ def _format_shell_instructions(
         base_script = textwrap.dedent(
             f"""\
             # dotbins - Add platform-specific binaries to PATH
-            _os=$(uname -s | tr '[:upper:]' '[:lower:]')
-            [[ "$_os" == "darwin" ]] && _os="macos"
+            case "$OSTYPE" in
+                darwin*) _os="macos" ;;
+                linux*) _os="linux" ;;
+                *) _os=$(uname -s | tr '[:upper:]' '[:lower:]') ;;
+            esac
 
-            _arch=$(uname -m)
+            _arch=${{CPUTYPE:-$(uname -m)}}  # zsh sets CPUTYPE, saving a fork
             [[ "$_arch" == "x86_64" ]] && _arch="amd64"
             [[ "$_arch" == "aarch64" || "$_arch" == "arm64" ]] && _arch="arm64"
 
@@ -164,7 +332,7 @@ def _format_shell_instructions(
         base_script = textwrap.dedent(
             f"""\
             # dotbins - Add platform-specific binaries to PATH
-            set -l _os (uname -s | tr '[:upper:]' '[:lower:]')
+            set -l _os (string lower (uname -s))
             test "$_os" = "darwin"; and set _os "macos"
 
             set -l _arch (uname -m)
@@ -349,18 +517,179 @@ def calculate_sha256(file_path: str | Path) -> str:
     sha256_hash = hashlib.sha256()
     with open(file_path, "rb") as f:
         # Read the file in chunks to handle large files efficiently
-        for byte_block in iter(lambda: f.read(4096), b""):
+        for byte_block in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b""):
             sha256_hash.update(byte_block)
     return sha256_hash.hexdigest()
 
 
-def extract_archive(archive_path: str | Path, dest_dir: str | Path) -> None:
+# Mappings for tar-based archives
+_TAR_MODES = {
+    ".tar": "r",
+    ".tar.gz": "r:gz",
+    ".tgz": "r:gz",
+    ".tar.bz2": "r:bz2",
+    ".tbz2": "r:bz2",
+    ".tar.xz": "r:xz",
+    ".txz": "r:xz",
+}
+
+
+# Single-file compression formats, by extension and by file header
+_COMPRESSED_EXTENSIONS: dict[str, Callable[..., Any]] = {
+    ".gz": gzip.open,
+    ".bz2": bz2.open,
+    ".xz": lzma.open,
+    ".lzma": lzma.open,
+}
+_COMPRESSED_MAGIC: dict[bytes, Callable[..., Any]] = {
+    b"\x1f\x8b": gzip.open,
+    b"BZh": bz2.open,
+    b"\xfd\x37\x7a\x58\x5a\x00": lzma.open,
+}
+
+
+def _member_matcher(members: list[str]) -> Callable[[str], bool] | None:
+    """Return a function that checks if an archive member matches any of the glob patterns.
+
+    Matches per path component like `Path.glob` (so `*` does not cross `/`).
+    Returns None if a pattern can't be matched this way (recursive `**` globs).
+    """
+    patterns = [PurePosixPath(m).parts for m in members]
+    if any("**" in parts for parts in patterns):
+        return None
+
+    def matches(name: str) -> bool:
+        parts = PurePosixPath(name).parts
+        return any(
+            len(parts) == len(pattern)
+            and all(fnmatch.fnmatchcase(part, pat) for part, pat in zip(parts, pattern))
+            for pattern in patterns
+        )
+
+    return matches
+
+
+def _extract_zip_members(
+    zip_file: zipfile.ZipFile,
+    dest_dir: Path,
+    matches: Callable[[str], bool],
+) -> bool:
+    """Extract matching members from a zip, return False if nothing matched."""
+    names = [name for name in zip_file.namelist() if matches(name)]
+    for name in names:
+        zip_file.extract(name, path=dest_dir)
+    return bool(names)
+
+
+def _extract_tar_members(
+    tar: tarfile.TarFile,
+    dest_dir: Path,
+    matches: Callable[[str], bool],
+) -> bool:
+    """Extract matching members from a tar in a single pass.
+
+    Returns False if nothing matched or a match is a link, whose target
+    would then also be needed.
+    """
+    found = False
+    for member in tar:
+        if not matches(member.name):
+            continue
+        if member.issym() or member.islnk():
+            return False
+        tar.extract(member, path=dest_dir)
+        found = True
+    return found
+
+
+def _write_beside(src: IO[bytes], dest: Path) -> Path:
+    """Write a stream to a temporary file next to `dest` and return its path."""
+    fd, tmp_path = _temp_sibling(dest)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            shutil.copyfileobj(src, f, DOWNLOAD_CHUNK_SIZE)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return tmp_path
+
+
+def extract_members_to(archive_path: str | Path, targets: dict[str, Path]) -> bool:  # noqa: PLR0912
+    """Stream archive members straight to their destination files.
+
+    Avoids extracting to a temporary directory when the exact member paths are
+    known. Each destination is replaced atomically, and only once all members
+    were found.
+
+    Args:
+        archive_path: Path to a zip or tar archive
+        targets: Mapping of member path (relative to the archive root) to destination
+
+    Returns:
+        False, without touching any destination, if the archive is not a zip or
+        tar, or a member is missing or not a regular file.
+
+    """
+    archive_path = Path(archive_path)
+    filename = archive_path.name.lower()
+    wanted = {posixpath.normpath(name): dest for name, dest in targets.items()}
+    written: dict[Path, Path] = {}
+    try:
+        if filename.endswith(".zip"):
+            with zipfile.ZipFile(archive_path) as zip_file:
+                for info in zip_file.infolist():
+                    dest = wanted.get(posixpath.normpath(info.filename))
+                    if dest is None:
+                        continue
+                    if info.is_dir() or stat.S_ISLNK(info.external_attr >> 16):
+                        return False
+                    with zip_file.open(info) as src:
+                        written[dest] = _write_beside(src, dest)
+        else:
+            mode = next((m for ext, m in _TAR_MODES.items() if filename.endswith(ext)), None)
+            if mode is None:
+                return False
+            with tarfile.open(archive_path, mode=mode) as tar:  # type: ignore[call-overload]
+                for member in tar:
+                    dest = wanted.get(posixpath.normpath(member.name))
+                    if dest is None:
+                        continue
+                    if not member.isfile():
+                        return False
+                    with tar.extractfile(member) as src:  # type: ignore[union-attr]
+                        written[dest] = _write_beside(src, dest)
+        if len(written) != len(set(wanted.values())):
+            return False
+        for dest, tmp_path in written.items():
+            os.replace(tmp_path, dest)
+        written.clear()
+        return True
+    finally:
+        for tmp_path in written.values():
+            tmp_path.unlink(missing_ok=True)
+
+
+def extract_archive(
+    archive_path: str | Path,
+    dest_dir: str | Path,
+    members: list[str] | None = None,
+) -> None:
     """Extract an archive to a destination directory.
 
     Supports zip, tar, tar.gz, tar.bz2, tar.xz, gz, bz2, and xz formats.
+
+    Args:
+        archive_path: Path to the archive
+        dest_dir: Directory to extract the archive to
+        members: Optional glob patterns (relative to the archive root) of the
+            files that are needed. For zip and tar archives only the matching
+            members are extracted, falling back to extracting everything if
+            a pattern matches nothing.
+
     """
     archive_path = Path(archive_path)
     dest_dir = Path(dest_dir)
+    matches = _member_matcher(members) if members else None
 
     try:
         filename = archive_path.name.lower()
@@ -368,31 +697,18 @@ def extract_archive(archive_path: str | Path, dest_dir: str | Path) -> None:
         # Handle zip files
         if filename.endswith(".zip"):
             with zipfile.ZipFile(archive_path) as zip_file:
-                zip_file.extractall(path=dest_dir)
+                if matches is None or not _extract_zip_members(zip_file, dest_dir, matches):
+                    zip_file.extractall(path=dest_dir)
             return
 
-        # Define mappings for tar-based archives
-        tar_formats = {
-            ".tar": "r",
-            ".tar.gz": "r:gz",
-            ".tgz": "r:gz",
-            ".tar.bz2": "r:bz2",
-            ".tbz2": "r:bz2",
-            ".tar.xz": "r:xz",
-            ".txz": "r:xz",
-        }
-
         # Handle tar archives
-        for ext, mode in tar_formats.items():
+        for ext, mode in _TAR_MODES.items():
             if filename.endswith(ext):
                 with tarfile.open(archive_path, mode=mode) as tar:  # type: ignore[call-overload]
-                    tar.extractall(path=dest_dir)
+                    if matches is None or not _extract_tar_members(tar, dest_dir, matches):
+                        tar.extractall(path=dest_dir)
                 return
 
-        # Get file magic header for compression detection
-        with open(archive_path, "rb") as f:
-            header = f.read(6)
-
         # Helper function for single-file decompression
         def extract_compressed(open_func: Callable[[Path, str], Any]) -> None:
             output_path = dest_dir / archive_path.stem
@@ -400,21 +716,24 @@ def extract_archive(archive_path: str | Path, dest_dir: str | Path) -> None:
                 open_func(archive_path, "rb") as f_in,
                 open(output_path, "wb") as f_out,
             ):
-                shutil.copyfileobj(f_in, f_out)
+                shutil.copyfileobj(f_in, f_out, DOWNLOAD_CHUNK_SIZE)
             if os.name != "nt":  # Skip on Windows
                 output_path.chmod(output_path.stat().st_mode | 0o755)
 
-        # Try each compression format based on extension or file header
-        if filename.endswith(".gz") or header.startswith(b"\x1f\x8b"):
-            extract_compressed(gzip.open)
-            return
-
-        if filename.endswith(".bz2") or header.startswith(b"BZh"):
-            extract_compressed(bz2.open)
-            return
-
-        if filename.endswith((".xz", ".lzma")) or header.startswith(b"\xfd\x37\x7a\x58\x5a\x00"):
-            extract_compressed(lzma.open)
+        # The extension decides, only sniff the file header if it doesn't
+        open_func = next(
+            (func for ext, func in _COMPRESSED_EXTENSIONS.items() if filename.endswith(ext)),
+            None,
+        )
+        if open_func is None:
+            with open(archive_path, "rb") as f:
+                header = f.read(6)
+            open_func = next(
+                (func for magic, func in _COMPRESSED_MAGIC.items() if header.startswith(magic)),
+                None,
+            )
+        if open_func is not None:
+            extract_compressed(open_func)
             return
 
         # Unsupported format
@@ -450,7 +769,7 @@ R = TypeVar("R")
 def execute_in_parallel(
     items: list[T],
     process_func: Callable[[T], R],
-    max_workers: int = 16,
+    max_workers: int = DEFAULT_MAX_WORKERS,
 ) -> list[R]:
     """Execute a function over a list of items in parallel.
 
@@ -468,6 +787,32 @@ def execute_in_parallel(
         return list(futures)
 
 
+def iterate_in_parallel(
+    items: list[T],
+    process_func: Callable[[T], R],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> Iterator[R]:
+    """Execute a function over a list of items in parallel, yielding results in order.
+
+    Unlike `execute_in_parallel`, each result is yielded as soon as it (and all
+    results before it) are available, so the caller can start working on the
+    first items while the remaining ones are still being processed.
+
+    Args:
+        items: List of items to process
+        process_func: Function to apply to each item
+        max_workers: Maximum number of parallel workers
+
+    Yields:
+        Results from process_func applied to each item, in the order of items
+
+    """
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items) or 1)) as ex:
+        futures = [ex.submit(process_func, item) for item in items]
+        for future in futures:
+            yield future.result()
+
+
 def humanize_time_ago(date_str: str) -> str:
     """Humanize a time ago string showing two largest time components."""
     # Note: Function doesn't properly handle future dates.
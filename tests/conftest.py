@@ -72,3 +72,9 @@ def create_dummy_archive() -> Callable:
             return dest_path
 
     return _create_archive
+
+
+@pytest.fixture(autouse=True)
+def _isolated_release_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep the on-disk release cache out of the user's home directory."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
@@ -6,14 +6,14 @@ import sys
 from typing import TYPE_CHECKING, Any
 from unittest.mock import patch
 
+import pytest
+
 from dotbins import cli
 from dotbins.config import Config, build_tool_config
 
 if TYPE_CHECKING:
     from pathlib import Path
 
-    import pytest
-
 
 def test_initialization(
     tmp_path: Path,
@@ -129,3 +129,17 @@ def test_cli_argument_parsing() -> None:
     args = parser.parse_args(["sync"])
     assert args.command == "sync"
     assert args.no_readme is False
+    assert args.max_workers == 16
+
+    args = parser.parse_args(["sync", "--max-workers", "32"])
+    assert args.max_workers == 32
+
+
+@pytest.mark.parametrize("value", ["0", "-1", "many"])
+def test_cli_rejects_invalid_max_workers(value: str, capsys: pytest.CaptureFixture[str]) -> None:
+    """Test that --max-workers only accepts positive integers."""
+    parser = cli.create_parser()
+    with pytest.raises(SystemExit) as exc_info:
+        parser.parse_args(["sync", "--max-workers", value])
+    assert exc_info.value.code == 2
+    assert "must be a positive integer" in capsys.readouterr().err
@@ -15,7 +15,7 @@ import requests
 
 from dotbins.cli import _get_tool
 from dotbins.config import Config, RawConfigDict, RawToolConfigDict
-from dotbins.utils import current_platform, log
+from dotbins.utils import current_platform, http_session, log
 
 if TYPE_CHECKING:
     from requests_mock import Mocker
@@ -681,7 +681,7 @@ def test_get_tool_command_with_remote_config(
         """,
     )
 
-    # Create a mock response for requests.get
+    # Create a mock response for the HTTP session's get
     @dataclass
     class MockResponse:
         content: bytes
@@ -728,7 +728,7 @@ def test_get_tool_command_with_remote_config(
         return destination
 
     with (
-        patch("dotbins.utils.requests.get", side_effect=mock_requests_get),
+        patch.object(http_session(), "get", side_effect=mock_requests_get),
         patch("dotbins.download.download_file", side_effect=mock_download_file),
         patch("dotbins.config.fetch_release_info", side_effect=mock_fetch_release_info),
     ):
@@ -1268,7 +1268,7 @@ def test_download_file_request_exception(
         raise requests.RequestException(err_msg)
 
     with (
-        patch("dotbins.utils.requests.get", side_effect=mock_requests_get),
+        patch.object(http_session(), "get", side_effect=mock_requests_get),
     ):
         config.sync_tools(verbose=False)  # Turn off verbose to reduce processing
 
@@ -2067,6 +2067,87 @@ def test_e2e_pin_to_manifest(
     assert manifest_info["tag"] == pinned_tag, "Manifest tag should remain pinned"
 
 
+def test_e2e_pin_to_manifest_up_to_date_skips_api(
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+    requests_mock: Mocker,
+) -> None:
+    """Test that pinned tools that are already installed don't hit the GitHub API."""
+    raw_config: RawConfigDict = {
+        "tools_dir": str(tmp_path),
+        "platforms": {"linux": ["amd64", "arm64"]},
+        "tools": {"mytool": {"repo": "fakeuser/mytool", "binary_name": "mybinary"}},
+    }
+    config = Config.from_dict(raw_config)
+    for arch in ["amd64", "arm64"]:
+        config.manifest.update_tool_info(
+            tool="mytool",
+            platform="linux",
+            arch=arch,
+            tag="v1.0.0",
+            sha256="sha256",
+            url=f"https://example.com/mytool-linux_{arch}.tar.gz",
+        )
+        bin_dir = config.bin_dir("linux", arch)
+        bin_dir.mkdir(parents=True, exist_ok=True)
+        (bin_dir / "mybinary").touch()
+
+    config.sync_tools(pin_to_manifest=True)
+
+    assert not requests_mock.called
+    assert len(config._update_summary.skipped) == 2
+    out = capsys.readouterr().out
+    assert "mytool v1.0.0 is already up to date for all targets" in out
+
+
+def test_e2e_identical_asset_digest_skips_download(
+    tmp_path: Path,
+    requests_mock: Mocker,
+) -> None:
+    """Test that a new release shipping the installed asset is not downloaded again."""
+    raw_config: RawConfigDict = {
+        "tools_dir": str(tmp_path),
+        "platforms": {"linux": ["amd64"]},
+        "tools": {"mytool": {"repo": "fakeuser/sametool", "binary_name": "mybinary"}},
+    }
+    config = Config.from_dict(raw_config)
+    config.manifest.update_tool_info(
+        tool="mytool",
+        platform="linux",
+        arch="amd64",
+        tag="v1.0.0",
+        sha256="abc123",
+        url="https://example.com/mytool-linux_amd64.tar.gz",
+    )
+    bin_dir = config.bin_dir("linux", "amd64")
+    bin_dir.mkdir(parents=True, exist_ok=True)
+    (bin_dir / "mybinary").touch()
+
+    requests_mock.get(
+        "https://api.github.com/repos/fakeuser/sametool/releases/latest",
+        json={
+            "tag_name": "v2.0.0",
+            "assets": [
+                {
+                    "name": "mytool-linux_amd64.tar.gz",
+                    "browser_download_url": "https://example.com/mytool-linux_amd64.tar.gz",
+                    "digest": "sha256:abc123",
+                },
+            ],
+        },
+    )
+
+    with patch("dotbins.download.download_file") as mock_download_file:
+        config.sync_tools()
+
+    mock_download_file.assert_not_called()
+    tool_info = config.manifest.get_tool_info("mytool", "linux", "amd64")
+    assert tool_info is not None
+    assert tool_info["tag"] == "v2.0.0"
+    assert tool_info["sha256"] == "abc123"
+    assert len(config._update_summary.skipped) == 1
+
+
 def test_current_but_platform_not_configured(
     tmp_path: Path,
     create_dummy_archive: Callable,
@@ -2123,6 +2204,126 @@ def test_current_but_platform_not_configured(
     assert "even if not configured" in out
 
 
+def test_e2e_shared_asset_is_downloaded_once(
+    tmp_path: Path,
+    create_dummy_archive: Callable,
+    requests_mock: Mocker,
+) -> None:
+    """Test that architectures resolving to the same asset share one download."""
+    raw_config: RawConfigDict = {
+        "tools_dir": str(tmp_path),
+        "platforms": {"macos": ["amd64", "arm64"]},
+        "tools": {
+            "unitool": {
+                "repo": "fakeuser/unitool",
+                "binary_name": "unitool",
+                "asset_patterns": "unitool-{version}-universal.tar.gz",
+            },
+        },
+    }
+    config = Config.from_dict(raw_config)
+
+    requests_mock.get(
+        "https://api.github.com/repos/fakeuser/unitool/releases/latest",
+        json={
+            "tag_name": "v1.0.0",
+            "assets": [
+                {
+                    "name": "unitool-1.0.0-universal.tar.gz",
+                    "browser_download_url": "https://example.com/unitool-1.0.0-universal.tar.gz",
+                },
+            ],
+        },
+    )
+
+    downloaded_urls = []
+
+    def mock_download_file(
+        url: str,
+        destination: str,
+        github_token: str | None,  # noqa: ARG001
+        verbose: bool,  # noqa: ARG001
+    ) -> str:
+        downloaded_urls.append(url)
+        create_dummy_archive(Path(destination), binary_names="unitool")
+        return destination
+
+    with patch("dotbins.download.download_file", side_effect=mock_download_file):
+        config.sync_tools()
+
+    assert downloaded_urls == ["https://example.com/unitool-1.0.0-universal.tar.gz"]
+    for arch in ["amd64", "arm64"]:
+        assert (config.bin_dir("macos", arch) / "unitool").exists()
+        tool_info = config.manifest.get_tool_info("unitool", "macos", arch)
+        assert tool_info is not None
+        assert tool_info["tag"] == "v1.0.0"
+    assert len(config._update_summary.updated) == 2
+
+
+def test_e2e_tools_sharing_an_asset(
+    tmp_path: Path,
+    create_dummy_archive: Callable,
+    requests_mock: Mocker,
+) -> None:
+    """Test that two tools installed from the same asset don't clash."""
+    raw_config: RawConfigDict = {
+        "tools_dir": str(tmp_path),
+        "platforms": {"linux": ["amd64"]},
+        "tools": {
+            "suite-a": {
+                "repo": "fakeuser/suite",
+                "binary_name": "suite-a",
+                "path_in_archive": "suite-a",
+            },
+            "suite-b": {
+                "repo": "fakeuser/suite",
+                "binary_name": "suite-b",
+                "path_in_archive": "suite-b",
+            },
+        },
+    }
+    config = Config.from_dict(raw_config)
+    requests_mock.get(
+        "https://api.github.com/repos/fakeuser/suite/releases/latest",
+        json={
+            "tag_name": "v1.0.0",
+            "assets": [
+                {
+                    "name": "suite-1.0.0-linux_amd64.tar.gz",
+                    "browser_download_url": "https://example.com/suite-1.0.0-linux_amd64.tar.gz",
+                },
+            ],
+        },
+    )
+
+    def mock_download_file(
+        url: str,  # noqa: ARG001
+        destination: str,
+        github_token: str | None,  # noqa: ARG001
+        verbose: bool,  # noqa: ARG001
+    ) -> str:
+        create_dummy_archive(Path(destination), binary_names=["suite-a", "suite-b"])
+        return destination
+
+    with patch("dotbins.download.download_file", side_effect=mock_download_file) as mock_download:
+        config.sync_tools()
+    assert mock_download.call_count == 1
+    bin_dir = config.bin_dir("linux", "amd64")
+    assert (bin_dir / "suite-a").exists()
+    assert (bin_dir / "suite-b").exists()
+    assert not config._update_summary.failed
+
+    # A failure to reuse the download only fails the tool that needed the copy
+    config = Config.from_dict({**raw_config, "tools_dir": str(tmp_path / "other")})
+    with (
+        patch("dotbins.download.download_file", side_effect=mock_download_file),
+        patch("dotbins.download.shutil.copyfile", side_effect=OSError("disk full")),
+    ):
+        config.sync_tools()
+    assert [entry.tool for entry in config._update_summary.updated] == ["suite-a"]
+    assert [entry.tool for entry in config._update_summary.failed] == ["suite-b"]
+
+
 def test_i686(
     tmp_path: Path,
     create_dummy_archive: Callable,
@@ -127,6 +127,27 @@ def test_manifest_save_creates_parent_dirs(tmp_path: Path) -> None:
     assert os.path.exists(nested_dir / "manifest.json")
 
 
+def test_manifest_save_is_atomic(tmp_path: Path) -> None:
+    """Test that a failed save leaves the previous manifest intact."""
+    manifest = Manifest(tmp_path)
+    manifest.update_tool_info(
+        tool="test",
+        platform="linux",
+        arch="amd64",
+        tag="1.0.0",
+        sha256="sha256",
+        url="https://example.com/test-1.0.0-linux_amd64.tar.gz",
+    )
+    before = (tmp_path / "manifest.json").read_text()
+
+    manifest.data["broken"] = object()  # not JSON serializable
+    with pytest.raises(TypeError):
+        manifest.save()
+
+    assert (tmp_path / "manifest.json").read_text() == before
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["manifest.json"]
+
+
 def test_manifest_load_invalid_json(tmp_path: Path) -> None:
     """Test loading from an invalid JSON file."""
     manifest_file = tmp_path / "manifest.json"
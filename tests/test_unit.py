@@ -111,6 +111,27 @@ def test_find_asset() -> None:
     assert bin_spec.matching_asset() == assets[1]
 
 
+def test_find_asset_prefers_exact_name() -> None:
+    """Test that an asset named exactly like the pattern wins over earlier regex matches."""
+    tool_config = build_tool_config(
+        tool_name="tool",
+        raw_data={
+            "repo": "test/repo",
+            "asset_patterns": "tool-{version}.tar.gz",
+        },
+        platforms={"linux": ["amd64"]},
+    )
+    tool_config._release_info = {
+        "tag_name": "v1.0.0",
+        "assets": [
+            {"name": "tool-1.0.0.tar.gz.sha256"},
+            {"name": "tool-1.0.0.tar.gz"},
+        ],
+    }
+    bin_spec = tool_config.bin_spec("amd64", "linux")
+    assert bin_spec.matching_asset() == {"name": "tool-1.0.0.tar.gz"}
+
+
 def test_download_file(requests_mock: Mocker, tmp_path: Path) -> None:
     """Test downloading a file from URL."""
     # Setup mock response
@@ -512,6 +533,64 @@ def test_extract_from_archive_multiple_binaries(
         assert content.strip()
 
 
+def test_extract_same_file_to_multiple_binary_names_from_temp_dir(
+    tmp_path: Path,
+    create_dummy_archive: Callable,
+) -> None:
+    """Test that a file found through a glob can be installed under several names."""
+    archive_path = tmp_path / "test.tar.gz"
+    create_dummy_archive(dest_path=archive_path, binary_names="tool", nested_dir="bin")
+    tool_config = build_tool_config(
+        tool_name="tool",
+        raw_data={
+            "repo": "test/tool",
+            "binary_name": ["tool", "tool-alias"],
+            "path_in_archive": ["bin/to*", "bin/tool"],
+        },
+    )
+    dest_dir = tmp_path / "out"
+    dotbins.download._extract_binary_from_archive(
+        archive_path,
+        dest_dir,
+        BinSpec(tool_config=tool_config, tag="v1.0.0", arch="amd64", platform="linux"),
+        verbose=False,
+    )
+    assert sorted(p.name for p in dest_dir.iterdir()) == ["tool", "tool-alias"]
+
+
+def test_extract_same_member_to_multiple_binary_names(
+    tmp_path: Path,
+    create_dummy_archive: Callable,
+) -> None:
+    """Test that one archive member can be installed under several binary names."""
+    archive_path = tmp_path / "test.tar.gz"
+    create_dummy_archive(dest_path=archive_path, binary_names="tool", nested_dir="bin")
+    tool_config = build_tool_config(
+        tool_name="tool",
+        raw_data={
+            "repo": "test/tool",
+            "binary_name": ["tool", "tool-alias"],
+            "path_in_archive": ["bin/tool", "./bin/tool"],
+        },
+    )
+    dest_dir = tmp_path / "out"
+    dotbins.download._extract_binary_from_archive(
+        archive_path,
+        dest_dir,
+        BinSpec(tool_config=tool_config, tag="v1.0.0", arch="amd64", platform="linux"),
+        verbose=False,
+    )
+    assert sorted(p.name for p in dest_dir.iterdir()) == ["tool", "tool-alias"]
+
+
+@pytest.mark.parametrize("max_workers", [0, -1])
+def test_sync_tools_rejects_invalid_max_workers(tmp_path: Path, max_workers: int) -> None:
+    """Test that sync_tools validates max_workers before doing any work."""
+    config = Config.from_dict({"tools_dir": str(tmp_path), "tools": {"tool": "owner/tool"}})
+    with pytest.raises(ValueError, match="max_workers must be a positive integer"):
+        config.sync_tools(max_workers=max_workers)
+
+
 def test_build_tool_config_skips_unknown_platforms() -> None:
     """Test that build_tool_config correctly skips unknown platforms in asset_patterns."""
     # Define a tool config with both valid and unknown platforms in asset_patterns
@@ -1,18 +1,39 @@
 """Tests for dotbins.utils."""
 
+from __future__ import annotations
+
 import bz2
 import gzip
+import json
 import lzma
 import os
 import tarfile
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from pathlib import Path
+from functools import partial
+from typing import TYPE_CHECKING
 from unittest.mock import patch
 
 import pytest
 
-from dotbins.utils import extract_archive, github_url_to_raw_url, humanize_time_ago, tag_to_version
+from dotbins.utils import (
+    _write_release_cache,
+    extract_archive,
+    extract_members_to,
+    fetch_release_info,
+    github_url_to_raw_url,
+    http_session,
+    humanize_time_ago,
+    release_cache_dir,
+    size_http_pool,
+    tag_to_version,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from requests_mock import Mocker
 
 
 def test_github_url_to_raw_url() -> None:
@@ -126,6 +147,46 @@ def test_extract_zip(archive_dirs: tuple[Path, Path, Path]) -> None:
     verify_extraction(dest_dir, test_file)
 
 
+def test_extract_targz_only_requested_members(archive_dirs: tuple[Path, Path, Path]) -> None:
+    """Test that only the members matching the given patterns are extracted."""
+    temp_dir, dest_dir, test_file = archive_dirs
+    readme = temp_dir / "README.md"
+    readme.write_text("docs")
+    archive_path = temp_dir / "archive.tar.gz"
+
+    with tarfile.open(archive_path, "w:gz") as tar:
+        tar.add(test_file, arcname=f"tool-1.0/{test_file.name}")
+        tar.add(readme, arcname="tool-1.0/README.md")
+
+    extract_archive(archive_path, dest_dir, members=["tool-*/test_binary"])
+    verify_extraction(dest_dir, test_file, "tool-1.0/test_binary")
+    assert not (dest_dir / "tool-1.0" / "README.md").exists()
+
+    # Falls back to extracting everything when nothing matches
+    extract_archive(archive_path, dest_dir, members=["missing"])
+    assert (dest_dir / "tool-1.0" / "README.md").exists()
+
+
+def test_extract_members_to(archive_dirs: tuple[Path, Path, Path]) -> None:
+    """Test streaming archive members straight to their destinations."""
+    temp_dir, dest_dir, test_file = archive_dirs
+    archive_path = temp_dir / "archive.zip"
+    with zipfile.ZipFile(archive_path, "w") as zip_file:
+        zip_file.write(test_file, arcname=f"bin/{test_file.name}")
+
+    # Nothing is written unless every member is found
+    targets = {"bin/test_binary": dest_dir / "a", "bin/missing": dest_dir / "b"}
+    assert not extract_members_to(archive_path, targets)
+    assert list(dest_dir.iterdir()) == []
+
+    assert extract_members_to(archive_path, {"./bin/test_binary": dest_dir / "tool"})
+    assert (dest_dir / "tool").read_text() == test_file.read_text()
+    assert list(dest_dir.iterdir()) == [dest_dir / "tool"]
+
+    # Single compressed files need the regular extraction
+    assert not extract_members_to(temp_dir / "test_binary.gz", {"test_binary": dest_dir / "x"})
+
+
 def test_extract_gz(archive_dirs: tuple[Path, Path, Path]) -> None:
     """Test extracting a single .gz file."""
     temp_dir, dest_dir, test_file = archive_dirs
@@ -254,3 +315,90 @@ def test_tag_to_version() -> None:
     assert tag_to_version("latest") == "latest"
     assert tag_to_version("1.0.0") == "1.0.0"
     assert tag_to_version("v-invalid") == "v-invalid"
+
+
+def test_fetch_release_info_uses_disk_cache(requests_mock: Mocker) -> None:
+    """Test that a fresh on-disk release is reused without another request."""
+    url = "https://api.github.com/repos/owner/cached/releases/latest"
+    requests_mock.get(url, json={"tag_name": "v1.0.0", "assets": []})
+    fetch_release_info.cache_clear()
+    assert fetch_release_info("owner/cached")["tag_name"] == "v1.0.0"
+    assert (release_cache_dir() / "owner_cached@latest.json").exists()
+
+    fetch_release_info.cache_clear()
+    assert fetch_release_info("owner/cached")["tag_name"] == "v1.0.0"
+    assert requests_mock.call_count == 1
+
+
+def test_fetch_release_info_revalidates_with_etag(requests_mock: Mocker) -> None:
+    """Test that a stale cached release is revalidated with If-None-Match."""
+    url = "https://api.github.com/repos/owner/etag/releases/latest"
+    requests_mock.get(
+        url,
+        json={"tag_name": "v1.0.0", "assets": []},
+        headers={"ETag": '"abc"'},
+    )
+    fetch_release_info.cache_clear()
+    fetch_release_info("owner/etag")
+
+    requests_mock.get(url, status_code=304)
+    fetch_release_info.cache_clear()
+    with patch("dotbins.utils.RELEASE_CACHE_TTL", 0):
+        assert fetch_release_info("owner/etag")["tag_name"] == "v1.0.0"
+    assert requests_mock.last_request.headers["If-None-Match"] == '"abc"'
+
+
+def test_release_cache_concurrent_writes(
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Test that threads writing the same release cache file don't clash."""
+    cache_file = tmp_path / "owner_repo@latest.json"
+    entries = [{"data": {"tag_name": f"v{i}"}, "padding": "x" * 100_000} for i in range(16)]
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        list(ex.map(partial(_write_release_cache, cache_file), entries))
+    assert "Could not write release cache" not in capsys.readouterr().out
+    assert json.loads(cache_file.read_text()) in entries
+    assert [p.name for p in tmp_path.iterdir()] == [cache_file.name]
+
+
+def test_fetch_release_info_warns_on_low_rate_limit(
+    requests_mock: Mocker,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Test that a nearly exhausted GitHub rate limit is reported."""
+    requests_mock.get(
+        "https://api.github.com/repos/owner/limited/releases/latest",
+        json={"tag_name": "v1.0.0", "assets": []},
+        headers={"X-RateLimit-Remaining": "2", "X-RateLimit-Reset": "1700000000"},
+    )
+    fetch_release_info.cache_clear()
+    fetch_release_info("owner/limited")
+    out = capsys.readouterr().out
+    assert "Only 2 GitHub API requests left" in out
+    assert requests_mock.last_request.headers["Accept"] == "application/vnd.github+json"
+
+
+def test_http_session_retries_rate_limits() -> None:
+    """Test that the shared session retries transient errors and rate limits."""
+    session = http_session()
+    assert http_session() is session
+    retries = session.get_adapter("https://api.github.com").max_retries
+    assert 429 in retries.status_forcelist
+    assert retries.respect_retry_after_header
+    assert session.headers["User-Agent"].startswith("dotbins/")
+
+
+def test_size_http_pool() -> None:
+    """Test that the connection pool grows to the number of workers."""
+    session = http_session.__wrapped__()  # fresh session, leave the shared one alone
+    adapter = session.get_adapter("https://api.github.com")
+    old_poolmanager = adapter.poolmanager
+    with patch("dotbins.utils.http_session", return_value=session):
+        size_http_pool(4)
+        assert adapter.poolmanager is old_poolmanager
+        assert adapter.poolmanager.connection_pool_kw["maxsize"] == 16
+        with patch.object(old_poolmanager, "clear", wraps=old_poolmanager.clear) as clear:
+            size_http_pool(64)
+        clear.assert_called_once()
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == 64